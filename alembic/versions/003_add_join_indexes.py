@@ -0,0 +1,72 @@
+"""Add composite indexes for task join queries
+
+Revision ID: 003_add_join_indexes
+Revises: 002_add_initial_task_statuses
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from typing import Sequence, Union
+
+# revision identifiers, used by Alembic.
+revision: str = '003_add_join_indexes'
+down_revision: Union[str, None] = '002_add_initial_task_statuses'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create indexes serving task lookups by assignee, tag and attachment.
+
+    The primary keys of task_assignee and task_tag start with task_id, so
+    filtering by user_id / tag_id can't use them. Indexes are built
+    CONCURRENTLY to avoid locking writes, which requires running outside
+    of the migration transaction.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_task_assignee_user',
+            'task_assignee',
+            ['user_id', 'task_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'idx_task_tag_tag',
+            'task_tag',
+            ['tag_id', 'task_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Serves WHERE task_id = $1 ORDER BY uploaded_at without a sort
+        op.create_index(
+            'idx_attachment_task',
+            'attachment',
+            ['task_id', 'uploaded_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop task join indexes."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_attachment_task',
+            table_name='attachment',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'idx_task_tag_tag',
+            table_name='task_tag',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'idx_task_assignee_user',
+            table_name='task_assignee',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -3,9 +3,11 @@ import asyncpg
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from api.schemas.task import TaskCreate, TaskResponse, TaskUpdate
-from dependencies import get_db_connection
+from application.services.task_service import TaskService
+from dependencies import get_db_connection, get_db_pool
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -55,17 +57,7 @@ async def create_task(
                 detail="Failed to create task",
             )
 
-        return TaskResponse(
-            id=row["id"],
-            title=row["title"],
-            description=row["description"],
-            status_id=row["status_id"],
-            creator_id=row["creator_id"],
-            deadline_start=row["deadline_start"],
-            deadline_end=row["deadline_end"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-        )
+        return TaskResponse.model_validate(dict(row))
 
     except asyncpg.ForeignKeyViolationError as e:
         raise HTTPException(
@@ -84,6 +76,55 @@ async def create_task(
         )
 
 
+@router.get(
+    "/",
+    response_class=StreamingResponse,
+    summary="List all tasks",
+    description="Stream all tasks as newline-delimited JSON",
+)
+async def list_tasks(
+    pool: Annotated[asyncpg.Pool, Depends(get_db_pool)],
+) -> StreamingResponse:
+    """Stream all tasks from database.
+
+    Tasks are written to the response as they are read from the database
+    cursor, one JSON object per line, instead of building the full list first.
+
+    Args:
+        pool: Database connection pool
+
+    Returns:
+        Streaming NDJSON response with task data
+
+    Raises:
+        HTTPException: If the tasks cursor cannot be opened
+    """
+    tasks = TaskService(pool).iter_tasks()
+    try:
+        # Open the connection and cursor before the 200 headers are sent,
+        # so database errors still become a 500 instead of a truncated body
+        first = await anext(tasks, None)
+    except Exception as e:
+        await tasks.aclose()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {e}",
+        )
+
+    async def body():
+        try:
+            if first is None:
+                return
+            yield first.model_dump_json() + "\n"
+            async for task in tasks:
+                yield task.model_dump_json() + "\n"
+        finally:
+            # Release the cursor connection even if the client disconnects
+            await tasks.aclose()
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/{task_id}",
     response_model=TaskResponse,
@@ -123,17 +164,7 @@ async def get_task(
             detail=f"Task with ID {task_id} not found",
         )
 
-    return TaskResponse(
-        id=task_row["id"],
-        title=task_row["title"],
-        description=task_row["description"],
-        status_id=task_row["status_id"],
-        creator_id=task_row["creator_id"],
-        deadline_start=task_row["deadline_start"],
-        deadline_end=task_row["deadline_end"],
-        created_at=task_row["created_at"],
-        updated_at=task_row["updated_at"],
-    )
+    return TaskResponse.model_validate(dict(task_row))
 
 
 @router.put(
@@ -226,17 +257,7 @@ async def update_task(
                 detail=f"Task with ID {task_id} not found",
             )
 
-        return TaskResponse(
-            id=row["id"],
-            title=row["title"],
-            description=row["description"],
-            status_id=row["status_id"],
-            creator_id=row["creator_id"],
-            deadline_start=row["deadline_start"],
-            deadline_end=row["deadline_end"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-        )
+        return TaskResponse.model_validate(dict(row))
     except asyncpg.ForeignKeyViolationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -6,7 +6,7 @@ between Pydantic schemas and domain models.
 """
 import asyncpg
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from fastapi import HTTPException, status
 
@@ -30,26 +30,26 @@ class TaskService:
     - Transaction management (if needed)
 
     Args:
-        db_conn: Database connection for repositories
+        db_pool: Database connection pool for repositories
         task_repo: Task repository instance (optional, created if not provided)
         user_repo: User repository instance (optional, for validation)
     """
 
     def __init__(
         self,
-        db_conn: asyncpg.Connection,
+        db_pool: asyncpg.Pool,
         task_repo: Optional[TaskRepository] = None,
         user_repo: Optional[object] = None,  # UserRepository interface (optional)
     ):
         """Initialize TaskService with dependencies.
 
         Args:
-            db_conn: Active database connection
+            db_pool: Database connection pool
             task_repo: Task repository (created if None)
             user_repo: User repository (optional, for user validation)
         """
-        self.db_conn = db_conn
-        self.task_repo = task_repo or TaskRepositoryImpl(db_conn)
+        self.db_pool = db_pool
+        self.task_repo = task_repo or TaskRepositoryImpl(db_pool)
         self.user_repo = user_repo  # Can be None if not needed
 
     async def create_task(self, task_data: TaskCreate, creator_id: Optional[int] = None) -> TaskResponse:
@@ -155,6 +155,15 @@ class TaskService:
         tasks = await self.task_repo.get_all()
         return [self._domain_to_response(task) for task in tasks]
 
+    async def iter_tasks(self) -> AsyncIterator[TaskResponse]:
+        """Stream all tasks without materializing the whole list.
+
+        Yields:
+            Tasks as TaskResponse, one at a time
+        """
+        async for task in self.task_repo.iter_all():
+            yield self._domain_to_response(task)
+
     async def get_tasks_by_creator(self, creator_id: int) -> List[TaskResponse]:
         """Get all tasks created by a specific user.
 
@@ -21,6 +21,10 @@ DB_POOL_MAX_QUERIES: int = int(os.getenv("DB_POOL_MAX_QUERIES", "50000"))
 DB_POOL_MAX_INACTIVE_LIFETIME: float = float(
     os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME", "300.0")
 )
+# Per-connection cache of prepared statements (asyncpg default is 100).
+# Repeated queries skip server-side parse/plan; set to 0 only behind pgbouncer
+# in transaction pooling mode.
+DB_POOL_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_POOL_STATEMENT_CACHE_SIZE", "100"))
 
 # JWT Authentication configuration
 SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
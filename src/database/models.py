@@ -13,6 +13,7 @@ from sqlalchemy import (
     Date,
     BigInteger,
     ForeignKey,
+    Index,
     Table,
 )
 from sqlalchemy.dialects.postgresql import UUID, INET
@@ -30,6 +31,7 @@ task_assignee = Table(
     Column("task_id", Integer, ForeignKey("task.id", ondelete="CASCADE"), primary_key=True),
     Column("user_id", Integer, ForeignKey("user.id", ondelete="CASCADE"), primary_key=True),
     Column("assigned_at", TIMESTAMP, server_default=func.now(), nullable=False),
+    Index("idx_task_assignee_user", "user_id", "task_id"),
 )
 
 task_tag = Table(
@@ -37,6 +39,7 @@ task_tag = Table(
     Base.metadata,
     Column("task_id", Integer, ForeignKey("task.id", ondelete="CASCADE"), primary_key=True),
     Column("tag_id", Integer, ForeignKey("tag.id", ondelete="CASCADE"), primary_key=True),
+    Index("idx_task_tag_tag", "tag_id", "task_id"),
 )
 
 
@@ -126,6 +129,7 @@ class Attachment(Base):
     """Attachment model."""
 
     __tablename__ = "attachment"
+    __table_args__ = (Index("idx_attachment_task", "task_id", "uploaded_at"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     task_id = Column(Integer, ForeignKey("task.id", ondelete="CASCADE"), nullable=False)
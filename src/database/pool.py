@@ -1,7 +1,6 @@
 """Database connection pool management."""
 import asyncpg
 from contextlib import asynccontextmanager
-from typing import Optional
 
 from fastapi import FastAPI
 
@@ -12,24 +11,21 @@ from config import (
     DB_POOL_COMMAND_TIMEOUT,
     DB_POOL_MAX_QUERIES,
     DB_POOL_MAX_INACTIVE_LIFETIME,
+    DB_POOL_STATEMENT_CACHE_SIZE,
 )
 
-# Global connection pool
-db_pool: Optional[asyncpg.Pool] = None
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage database connection pool lifecycle.
 
     Creates connection pool on startup and closes it on shutdown.
-    This ensures efficient connection reuse across requests.
+    This ensures efficient connection reuse across requests. The pool is
+    only published on app.state, where the request dependencies read it.
 
     Args:
         app: FastAPI application instance
     """
-    global db_pool
-
     # Startup: create connection pool
     db_pool = await asyncpg.create_pool(
         DATABASE_URL,
@@ -38,7 +34,10 @@ async def lifespan(app: FastAPI):
         command_timeout=DB_POOL_COMMAND_TIMEOUT,
         max_queries=DB_POOL_MAX_QUERIES,
         max_inactive_connection_lifetime=DB_POOL_MAX_INACTIVE_LIFETIME,
+        statement_cache_size=DB_POOL_STATEMENT_CACHE_SIZE,
     )
+    # Request-time dependencies read the pool from app state
+    app.state.db_pool = db_pool
     print("Database connection pool created")
 
     yield
@@ -47,11 +46,3 @@ async def lifespan(app: FastAPI):
     await db_pool.close()
     print("Database connection pool closed")
 
-
-def get_pool() -> Optional[asyncpg.Pool]:
-    """Get database connection pool.
-
-    Returns:
-        Database connection pool or None if not initialized
-    """
-    return db_pool
@@ -1,29 +1,38 @@
 """FastAPI dependencies."""
 import asyncpg
-from fastapi import HTTPException, status
+from fastapi import Request
 
-from application.services import get_pool
 
+async def get_db_pool(request: Request) -> asyncpg.Pool:
+    """Get database connection pool.
 
-async def get_db_connection() -> asyncpg.Connection:
+    Used by endpoints that go through repositories, which acquire
+    connections from the pool per operation themselves.
+
+    Args:
+        request: Current request (the pool lives on app.state)
+
+    Returns:
+        Database connection pool
+    """
+    return request.app.state.db_pool
+
+
+async def get_db_connection(request: Request) -> asyncpg.Connection:
     """Get database connection from pool.
 
     This dependency provides a connection from the connection pool.
     The connection is automatically returned to the pool after use.
 
+    The pool is stored on app.state by lifespan before the application
+    starts accepting requests, so no per-request initialization check is
+    needed: if pool creation fails, startup fails.
+
+    Args:
+        request: Current request (the pool lives on app.state)
+
     Yields:
         Database connection from pool
-
-    Raises:
-        HTTPException: If connection pool is not initialized
     """
-    pool = get_pool()
-    if pool is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Database connection pool not initialized",
-        )
-
-    async with pool.acquire() as connection:
+    async with request.app.state.db_pool.acquire() as connection:
         yield connection
-
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Optional
 
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from .tag import Tag    
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     # Required fields
     id: int
@@ -25,10 +25,11 @@ class Task:
     deadline_start: Optional[date] = None
     deadline_end: Optional[date] = None
     
-    # Collections with defaults
-    assignees: list["User"] = field(default_factory=list)
-    attachments: list["Attachment"] = field(default_factory=list)
-    tags: list["Tag"] = field(default_factory=list)
+    # Collections: None means "not loaded"; list queries leave them unloaded
+    # and the repository populates them on demand (prefetch_related)
+    assignees: Optional[list["User"]] = None
+    attachments: Optional[list["Attachment"]] = None
+    tags: Optional[list["Tag"]] = None
 
     def __post_init__(self) -> None:
         """Validate task data after initialization."""
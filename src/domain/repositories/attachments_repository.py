@@ -5,21 +5,21 @@ from domain.models.attachment import Attachment
 
 class AttachmentsRepository(ABC):
     @abstractmethod
-    def create(self, attachment: Attachment) -> Attachment:
+    async def create(self, attachment: Attachment) -> Attachment:
         pass
 
     @abstractmethod
-    def delete(self, attachment_id: int) -> None:
+    async def delete(self, attachment_id: int) -> None:
         pass
 
     @abstractmethod
-    def get_all(self) -> List[Attachment]:
+    async def get_all(self) -> List[Attachment]:
         pass
 
     @abstractmethod
-    def get_by_task_id(self, task_id: int) -> List[Attachment]:
+    async def get_by_task_id(self, task_id: int) -> List[Attachment]:
         pass
 
     @abstractmethod
-    def get_by_id(self, attachment_id: int) -> Optional[Attachment]:
+    async def get_by_id(self, attachment_id: int) -> Optional[Attachment]:
         pass
\ No newline at end of file
@@ -6,17 +6,17 @@ from domain.models.task import Task
 
 class TagRepository(ABC):
     @abstractmethod
-    def create(self, tag: Tag) -> Tag:
+    async def create(self, tag: Tag) -> Tag:
         pass
 
     @abstractmethod
-    def delete(self, tag_id: int) -> None:
+    async def delete(self, tag_id: int) -> None:
         pass
 
     @abstractmethod
-    def get_all(self) -> List[Tag]:
+    async def get_all(self) -> List[Tag]:
         pass
 
     @abstractmethod
-    def get_by_id(self, tag_id: int) -> Optional[Tag]:
+    async def get_by_id(self, tag_id: int) -> Optional[Tag]:
         pass
\ No newline at end of file
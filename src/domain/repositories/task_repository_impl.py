@@ -5,7 +5,9 @@ for PostgreSQL database using asyncpg driver.
 """
 import asyncio
 import asyncpg
-from typing import List, Optional
+from collections import defaultdict
+from operator import itemgetter
+from typing import AsyncIterator, Dict, List, Optional
 from datetime import date, datetime
 
 from domain.models.task import Task
@@ -14,6 +16,19 @@ from domain.models.tag import Tag
 from domain.models.attachment import Attachment
 from domain.repositories.task_repository import TaskRepository
 
+# Task columns in Task constructor field order; extracts a whole row in one C-level call
+_TASK_COLS = itemgetter(
+    "id",
+    "title",
+    "status_id",
+    "creator_id",
+    "created_at",
+    "updated_at",
+    "description",
+    "deadline_start",
+    "deadline_end",
+)
+
 
 class TaskRepositoryImpl(TaskRepository):
     """PostgreSQL implementation of TaskRepository using asyncpg.
@@ -21,23 +36,27 @@ class TaskRepositoryImpl(TaskRepository):
     This repository maps database records to domain models and handles
     all database operations for Task entities.
 
+    Every operation acquires its own connection from the pool, so independent
+    queries (e.g. loading assignees, tags and attachments) run concurrently
+    instead of being serialized on a single connection.
+
     Args:
-        db_conn: asyncpg database connection (should be provided via dependency injection)
+        db_pool: asyncpg connection pool (should be provided via dependency injection)
     """
 
-    def __init__(self, db_conn: asyncpg.Connection):
-        """Initialize repository with database connection.
+    def __init__(self, db_pool: asyncpg.Pool):
+        """Initialize repository with database connection pool.
 
         Args:
-            db_conn: Active asyncpg connection (managed by connection pool)
+            db_pool: asyncpg connection pool shared across requests
         """
-        self.db_conn = db_conn
+        self.db_pool = db_pool
 
     def _row_to_task(self, row: asyncpg.Record) -> Task:
         """Convert database row to Task domain model.
 
         This is a helper method to map asyncpg.Record to Task domain model.
-        It handles type conversions and default values.
+        Every query selecting a task must return all columns in _TASK_COLS.
 
         Args:
             row: Database record from asyncpg
@@ -45,135 +64,161 @@ class TaskRepositoryImpl(TaskRepository):
         Returns:
             Task domain model instance
         """
-        return Task(
-            id=row["id"],
-            title=row["title"],
-            status_id=row["status_id"],
-            creator_id=row["creator_id"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-            description=row.get("description"),  # Optional field
-            deadline_start=row.get("deadline_start"),  # Optional field
-            deadline_end=row.get("deadline_end"),  # Optional field
-            # Collections are loaded separately via _load_related_entities
-            assignees=[],
-            attachments=[],
-            tags=[],
-        )
+        # Collections stay unloaded (None) until prefetch_related is called
+        return Task(*_TASK_COLS(row))
 
-    async def _load_assignees(self, task_id: int) -> List[User]:
-        """Load assignees for a task.
+    def _rows_to_tasks(self, rows: List[asyncpg.Record]) -> List[Task]:
+        """Convert a list of database rows to Task domain models.
 
         Args:
-            task_id: Task identifier
+            rows: Database records from asyncpg
 
         Returns:
-            List of User domain models assigned to the task
+            List of Task domain model instances
         """
-        rows = await self.db_conn.fetch(
-            """
-            SELECT u.id, u.username, u.email, u.password_hash, u.created_at, u.last_login
-            FROM "user" u
-            INNER JOIN task_assignee ta ON u.id = ta.user_id
-            WHERE ta.task_id = $1
-            ORDER BY ta.assigned_at
-            """,
-            task_id,
-        )
-        return [
-            User(
-                id=row["id"],
-                username=row["username"],
-                email=row["email"],
-                password_hash=row["password_hash"],
-                created_at=row["created_at"],
-                last_login=row.get("last_login"),
+        cols = _TASK_COLS
+        return [Task(*cols(row)) for row in rows]
+
+    async def _load_assignees(self, task_ids: List[int]) -> Dict[int, List[User]]:
+        """Load assignees for a batch of tasks in one query.
+
+        Args:
+            task_ids: Task identifiers
+
+        Returns:
+            Mapping of task ID to User domain models assigned to the task
+        """
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT ta.task_id, u.id, u.username, u.email, u.password_hash, u.created_at, u.last_login
+                FROM "user" u
+                INNER JOIN task_assignee ta ON u.id = ta.user_id
+                WHERE ta.task_id = ANY($1::int[])
+                ORDER BY ta.assigned_at
+                """,
+                task_ids,
+            )
+        assignees: Dict[int, List[User]] = defaultdict(list)
+        for row in rows:
+            assignees[row["task_id"]].append(
+                User(
+                    id=row["id"],
+                    username=row["username"],
+                    email=row["email"],
+                    password_hash=row["password_hash"],
+                    created_at=row["created_at"],
+                    last_login=row.get("last_login"),
+                )
             )
-            for row in rows
-        ]
+        return assignees
 
-    async def _load_tags(self, task_id: int) -> List[Tag]:
-        """Load tags for a task.
+    async def _load_tags(self, task_ids: List[int]) -> Dict[int, List[Tag]]:
+        """Load tags for a batch of tasks in one query.
 
         Args:
-            task_id: Task identifier
+            task_ids: Task identifiers
 
         Returns:
-            List of Tag domain models associated with the task
+            Mapping of task ID to Tag domain models associated with the task
         """
-        rows = await self.db_conn.fetch(
-            """
-            SELECT t.id, t.name, t.created_at, t.updated_at
-            FROM tag t
-            INNER JOIN task_tag tt ON t.id = tt.tag_id
-            WHERE tt.task_id = $1
-            ORDER BY t.name
-            """,
-            task_id,
-        )
-        return [
-            Tag(
-                id=row["id"],
-                name=row["name"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT tt.task_id, t.id, t.name, t.created_at, t.updated_at
+                FROM tag t
+                INNER JOIN task_tag tt ON t.id = tt.tag_id
+                WHERE tt.task_id = ANY($1::int[])
+                ORDER BY t.name
+                """,
+                task_ids,
+            )
+        tags: Dict[int, List[Tag]] = defaultdict(list)
+        for row in rows:
+            tags[row["task_id"]].append(
+                Tag(
+                    id=row["id"],
+                    name=row["name"],
+                    created_at=row["created_at"],
+                    updated_at=row["updated_at"],
+                )
             )
-            for row in rows
-        ]
+        return tags
 
-    async def _load_attachments(self, task_id: int) -> List[Attachment]:
-        """Load attachments for a task.
+    async def _load_attachments(self, task_ids: List[int]) -> Dict[int, List[Attachment]]:
+        """Load attachments for a batch of tasks in one query.
 
         Args:
-            task_id: Task identifier
+            task_ids: Task identifiers
 
         Returns:
-            List of Attachment domain models for the task
+            Mapping of task ID to Attachment domain models for the task
         """
-        rows = await self.db_conn.fetch(
-            """
-            SELECT id, task_id, filename, content_type, storage_path, size_bytes, uploaded_at
-            FROM attachment
-            WHERE task_id = $1
-            ORDER BY uploaded_at
-            """,
-            task_id,
-        )
-        return [
-            Attachment(
-                id=row["id"],
-                task_id=row["task_id"],
-                filename=row["filename"],
-                storage_path=row["storage_path"],
-                uploaded_at=row["uploaded_at"],
-                content_type=row.get("content_type"),
-                size_bytes=row.get("size_bytes"),
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT id, task_id, filename, content_type, storage_path, size_bytes, uploaded_at
+                FROM attachment
+                WHERE task_id = ANY($1::int[])
+                ORDER BY uploaded_at
+                """,
+                task_ids,
             )
-            for row in rows
-        ]
+        attachments: Dict[int, List[Attachment]] = defaultdict(list)
+        for row in rows:
+            attachments[row["task_id"]].append(
+                Attachment(
+                    id=row["id"],
+                    task_id=row["task_id"],
+                    filename=row["filename"],
+                    storage_path=row["storage_path"],
+                    uploaded_at=row["uploaded_at"],
+                    content_type=row.get("content_type"),
+                    size_bytes=row.get("size_bytes"),
+                )
+            )
+        return attachments
 
     async def _load_related_entities(self, task: Task) -> Task:
         """Load all related entities (assignees, tags, attachments) for a task.
 
-        This method populates the collections in the Task domain model.
-        It's called after loading the main task data.
-
         Args:
             task: Task domain model (without collections)
 
         Returns:
             Task domain model with populated collections
         """
-        # Load all related entities in parallel for better performance
+        await self.prefetch_related([task])
+        return task
+
+    async def prefetch_related(self, tasks: List[Task]) -> List[Task]:
+        """Load assignees, tags and attachments for a batch of tasks.
+
+        List queries return tasks with unloaded (None) collections; callers
+        that need them call this once for the whole list. It issues three
+        queries in total regardless of the number of tasks.
+
+        Args:
+            tasks: Task domain models to populate
+
+        Returns:
+            The same tasks with populated collections
+        """
+        if not tasks:
+            return tasks
+
+        task_ids = [task.id for task in tasks]
+        # Load all related entities in parallel, each on its own pool connection
         assignees, tags, attachments = await asyncio.gather(
-            self._load_assignees(task.id),
-            self._load_tags(task.id),
-            self._load_attachments(task.id),
+            self._load_assignees(task_ids),
+            self._load_tags(task_ids),
+            self._load_attachments(task_ids),
         )
-        task.assignees = assignees
-        task.tags = tags
-        task.attachments = attachments
-        return task
+        for task in tasks:
+            task.assignees = assignees.get(task.id, [])
+            task.tags = tags.get(task.id, [])
+            task.attachments = attachments.get(task.id, [])
+        return tasks
 
     async def create(self, task: Task) -> Task:
         """Create a new task in the database.
@@ -188,38 +233,52 @@ class TaskRepositoryImpl(TaskRepository):
             ValueError: If task creation fails
             asyncpg.ForeignKeyViolationError: If foreign key constraint violated
         """
-        row = await self.db_conn.fetchrow(
-            """
-            INSERT INTO task (title, description, status_id, creator_id, deadline_start, deadline_end)
-            VALUES ($1, $2, $3, $4, $5, $6)
-            RETURNING id, title, description, status_id, creator_id, deadline_start, deadline_end, created_at, updated_at
-            """,
-            task.title,
-            task.description,
-            task.status_id,
-            task.creator_id,
-            task.deadline_start,
-            task.deadline_end,
-        )
-
-        if not row:
-            raise ValueError("Failed to create task")
-
-        created_task = self._row_to_task(row)
-
-        # If task has assignees, tags, or attachments, add them
-        # Note: For new tasks, collections are usually empty, but we handle it anyway
-        if task.assignees or task.tags or task.attachments:
-            # Add assignees
-            for user in task.assignees:
-                await self.assign_task_to_user(created_task.id, user.id)
-
-            # Add tags
-            for tag in task.tags:
-                await self.add_tag(created_task.id, tag.id)
-
-            # Note: Attachments are usually created separately via AttachmentRepository
-            # but if they're provided, we could add them here
+        # The task row and its links are written on one connection inside a
+        # transaction, so a failed link insert doesn't leave a half-created task
+        async with self.db_pool.acquire() as conn:
+            async with conn.transaction():
+                row = await conn.fetchrow(
+                    """
+                    INSERT INTO task (title, description, status_id, creator_id, deadline_start, deadline_end)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                    RETURNING id, title, description, status_id, creator_id, deadline_start, deadline_end, created_at, updated_at
+                    """,
+                    task.title,
+                    task.description,
+                    task.status_id,
+                    task.creator_id,
+                    task.deadline_start,
+                    task.deadline_end,
+                )
+
+                if not row:
+                    raise ValueError("Failed to create task")
+
+                created_task = self._row_to_task(row)
+
+                # If task has assignees or tags, add them
+                # Note: For new tasks, collections are usually empty, but we handle it anyway
+                if task.assignees:
+                    await conn.executemany(
+                        """
+                        INSERT INTO task_assignee (task_id, user_id)
+                        VALUES ($1, $2)
+                        ON CONFLICT (task_id, user_id) DO NOTHING
+                        """,
+                        [(created_task.id, user.id) for user in task.assignees],
+                    )
+
+                if task.tags:
+                    await conn.executemany(
+                        """
+                        INSERT INTO task_tag (task_id, tag_id)
+                        VALUES ($1, $2)
+                        ON CONFLICT (task_id, tag_id) DO NOTHING
+                        """,
+                        [(created_task.id, tag.id) for tag in task.tags],
+                    )
+
+                # Note: Attachments are usually created separately via AttachmentRepository
 
         return created_task
 
@@ -232,10 +291,11 @@ class TaskRepositoryImpl(TaskRepository):
         Raises:
             ValueError: If task not found
         """
-        result = await self.db_conn.execute(
-            "DELETE FROM task WHERE id = $1",
-            task_id,
-        )
+        async with self.db_pool.acquire() as conn:
+            result = await conn.execute(
+                "DELETE FROM task WHERE id = $1",
+                task_id,
+            )
         # result is a string like "DELETE 1" or "DELETE 0"
         if result == "DELETE 0":
             raise ValueError(f"Task with ID {task_id} not found")
@@ -252,25 +312,26 @@ class TaskRepositoryImpl(TaskRepository):
         Raises:
             ValueError: If task not found
         """
-        row = await self.db_conn.fetchrow(
-            """
-            UPDATE task
-            SET title = $1,
-                description = $2,
-                status_id = $3,
-                deadline_start = $4,
-                deadline_end = $5,
-                updated_at = NOW()
-            WHERE id = $6
-            RETURNING id, title, description, status_id, creator_id, deadline_start, deadline_end, created_at, updated_at
-            """,
-            task.title,
-            task.description,
-            task.status_id,
-            task.deadline_start,
-            task.deadline_end,
-            task.id,
-        )
+        async with self.db_pool.acquire() as conn:
+            row = await conn.fetchrow(
+                """
+                UPDATE task
+                SET title = $1,
+                    description = $2,
+                    status_id = $3,
+                    deadline_start = $4,
+                    deadline_end = $5,
+                    updated_at = NOW()
+                WHERE id = $6
+                RETURNING id, title, description, status_id, creator_id, deadline_start, deadline_end, created_at, updated_at
+                """,
+                task.title,
+                task.description,
+                task.status_id,
+                task.deadline_start,
+                task.deadline_end,
+                task.id,
+            )
 
         if not row:
             raise ValueError(f"Task with ID {task.id} not found")
@@ -284,26 +345,59 @@ class TaskRepositoryImpl(TaskRepository):
 
         Returns:
             List of all Task domain models
+            (collections not loaded, see prefetch_related)
         """
-        rows = await self.db_conn.fetch(
-            """
-            SELECT id, title, description, status_id, creator_id, deadline_start, deadline_end, created_at, updated_at
-            FROM task
-            ORDER BY created_at DESC
-            """
-        )
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT id, title, description, status_id, creator_id, deadline_start, deadline_end, created_at, updated_at
+                FROM task
+                ORDER BY created_at DESC
+                """
+            )
 
-        tasks = [self._row_to_task(row) for row in rows]
+        return self._rows_to_tasks(rows)
 
-        # Load related entities for all tasks
-        # Note: This could be optimized with batch loading, but for simplicity we load individually
-        for task in tasks:
-            await self._load_related_entities(task)
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[Task]:
+        """Stream all tasks from the database batch by batch.
 
-        return tasks
+        Rows are read through a server-side cursor, so only one batch is
+        held in memory and callers can start emitting tasks before the
+        whole table has been read. Collections are not loaded: the cursor
+        holds a pool connection for the whole stream, and prefetching would
+        acquire more connections per stream.
+
+        Args:
+            batch_size: Number of rows fetched from the cursor per round-trip
+
+        Yields:
+            Task domain models in the same order as get_all
+        """
+        async with self.db_pool.acquire() as conn:
+            # Server-side cursors only exist inside a transaction
+            async with conn.transaction():
+                cursor = await conn.cursor(
+                    """
+                    SELECT id, title, description, status_id, creator_id, deadline_start, deadline_end, created_at, updated_at
+                    FROM task
+                    ORDER BY created_at DESC
+                    """
+                )
+                while True:
+                    rows = await cursor.fetch(batch_size)
+                    if not rows:
+                        break
+
+                    for task in self._rows_to_tasks(rows):
+                        yield task
 
     async def get_by_id(self, task_id: int) -> Optional[Task]:
-        """Get a task by its ID.
+        """Get a task by its ID together with its related entities.
+
+        The task, assignees, tags and attachments are fetched in a single
+        round-trip with LEFT JOINs; the resulting cross product is
+        de-duplicated in Python. This suits tasks with a handful of
+        children per collection.
 
         Args:
             task_id: Task identifier
@@ -311,20 +405,97 @@ class TaskRepositoryImpl(TaskRepository):
         Returns:
             Task domain model if found, None otherwise
         """
-        row = await self.db_conn.fetchrow(
-            """
-            SELECT id, title, description, status_id, creator_id, deadline_start, deadline_end, created_at, updated_at
-            FROM task
-            WHERE id = $1
-            """,
-            task_id,
-        )
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT t.id, t.title, t.description, t.status_id, t.creator_id,
+                       t.deadline_start, t.deadline_end, t.created_at, t.updated_at,
+                       u.id AS user_id, u.username, u.email, u.password_hash,
+                       u.created_at AS user_created_at, u.last_login, ta.assigned_at,
+                       tg.id AS tag_id, tg.name AS tag_name,
+                       tg.created_at AS tag_created_at, tg.updated_at AS tag_updated_at,
+                       a.id AS attachment_id, a.filename, a.content_type, a.storage_path,
+                       a.size_bytes, a.uploaded_at
+                FROM task t
+                LEFT JOIN task_assignee ta ON ta.task_id = t.id
+                LEFT JOIN "user" u ON u.id = ta.user_id
+                LEFT JOIN task_tag tt ON tt.task_id = t.id
+                LEFT JOIN tag tg ON tg.id = tt.tag_id
+                LEFT JOIN attachment a ON a.task_id = t.id
+                WHERE t.id = $1
+                """,
+                task_id,
+            )
 
-        if not row:
+        if not rows:
             return None
 
-        task = self._row_to_task(row)
-        return await self._load_related_entities(task)
+        return self._joined_rows_to_task(rows)
+
+    def _joined_rows_to_task(self, rows: List[asyncpg.Record]) -> Task:
+        """Build a Task with collections from get_by_id joined rows.
+
+        Each child is keyed by its ID to drop the duplicates produced by
+        the joins, then ordered the same way as the batched loaders.
+
+        Args:
+            rows: Joined database records for a single task
+
+        Returns:
+            Task domain model with populated collections
+        """
+        task = self._row_to_task(rows[0])
+        assignees: Dict[int, tuple] = {}
+        tags: Dict[int, tuple] = {}
+        attachments: Dict[int, tuple] = {}
+
+        for row in rows:
+            user_id = row["user_id"]
+            if user_id is not None and user_id not in assignees:
+                assignees[user_id] = (
+                    row["assigned_at"],
+                    User(
+                        id=user_id,
+                        username=row["username"],
+                        email=row["email"],
+                        password_hash=row["password_hash"],
+                        created_at=row["user_created_at"],
+                        last_login=row["last_login"],
+                    ),
+                )
+
+            tag_id = row["tag_id"]
+            if tag_id is not None and tag_id not in tags:
+                tags[tag_id] = (
+                    row["tag_name"],
+                    Tag(
+                        id=tag_id,
+                        name=row["tag_name"],
+                        created_at=row["tag_created_at"],
+                        updated_at=row["tag_updated_at"],
+                    ),
+                )
+
+            attachment_id = row["attachment_id"]
+            if attachment_id is not None and attachment_id not in attachments:
+                attachments[attachment_id] = (
+                    row["uploaded_at"],
+                    Attachment(
+                        id=attachment_id,
+                        task_id=task.id,
+                        filename=row["filename"],
+                        storage_path=row["storage_path"],
+                        uploaded_at=row["uploaded_at"],
+                        content_type=row["content_type"],
+                        size_bytes=row["size_bytes"],
+                    ),
+                )
+
+        by_key = itemgetter(0)
+        task.assignees = [user for _, user in sorted(assignees.values(), key=by_key)]
+        task.tags = [tag for _, tag in sorted(tags.values(), key=by_key)]
+        task.attachments = [att for _, att in sorted(attachments.values(), key=by_key)]
+        return task
 
     async def get_by_creator_id(self, creator_id: int) -> List[Task]:
         """Get all tasks created by a specific user.
@@ -334,24 +505,20 @@ class TaskRepositoryImpl(TaskRepository):
 
         Returns:
             List of Task domain models created by the user
+            (collections not loaded, see prefetch_related)
         """
-        rows = await self.db_conn.fetch(
-            """
-            SELECT id, title, description, status_id, creator_id, deadline_start, deadline_end, created_at, updated_at
-            FROM task
-            WHERE creator_id = $1
-            ORDER BY created_at DESC
-            """,
-            creator_id,
-        )
-
-        tasks = [self._row_to_task(row) for row in rows]
-
-        # Load related entities
-        for task in tasks:
-            await self._load_related_entities(task)
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT id, title, description, status_id, creator_id, deadline_start, deadline_end, created_at, updated_at
+                FROM task
+                WHERE creator_id = $1
+                ORDER BY created_at DESC
+                """,
+                creator_id,
+            )
 
-        return tasks
+        return self._rows_to_tasks(rows)
 
     async def assign_task_to_user(self, task_id: int, user_id: int) -> None:
         """Assign a task to a user.
@@ -364,15 +531,16 @@ class TaskRepositoryImpl(TaskRepository):
             asyncpg.UniqueViolationError: If assignment already exists
             asyncpg.ForeignKeyViolationError: If task or user not found
         """
-        await self.db_conn.execute(
-            """
-            INSERT INTO task_assignee (task_id, user_id)
-            VALUES ($1, $2)
-            ON CONFLICT (task_id, user_id) DO NOTHING
-            """,
-            task_id,
-            user_id,
-        )
+        async with self.db_pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO task_assignee (task_id, user_id)
+                VALUES ($1, $2)
+                ON CONFLICT (task_id, user_id) DO NOTHING
+                """,
+                task_id,
+                user_id,
+            )
 
     async def unassign_task_from_user(self, task_id: int, user_id: int) -> None:
         """Unassign a task from a user.
@@ -381,14 +549,15 @@ class TaskRepositoryImpl(TaskRepository):
             task_id: Task identifier
             user_id: User identifier
         """
-        await self.db_conn.execute(
-            """
-            DELETE FROM task_assignee
-            WHERE task_id = $1 AND user_id = $2
-            """,
-            task_id,
-            user_id,
-        )
+        async with self.db_pool.acquire() as conn:
+            await conn.execute(
+                """
+                DELETE FROM task_assignee
+                WHERE task_id = $1 AND user_id = $2
+                """,
+                task_id,
+                user_id,
+            )
 
     async def get_all_assigned_to_user(self, user_id: int) -> List[Task]:
         """Get all tasks assigned to a specific user.
@@ -398,25 +567,21 @@ class TaskRepositoryImpl(TaskRepository):
 
         Returns:
             List of Task domain models assigned to the user
+            (collections not loaded, see prefetch_related)
         """
-        rows = await self.db_conn.fetch(
-            """
-            SELECT t.id, t.title, t.description, t.status_id, t.creator_id, t.deadline_start, t.deadline_end, t.created_at, t.updated_at
-            FROM task t
-            INNER JOIN task_assignee ta ON t.id = ta.task_id
-            WHERE ta.user_id = $1
-            ORDER BY t.created_at DESC
-            """,
-            user_id,
-        )
-
-        tasks = [self._row_to_task(row) for row in rows]
-
-        # Load related entities
-        for task in tasks:
-            await self._load_related_entities(task)
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT t.id, t.title, t.description, t.status_id, t.creator_id, t.deadline_start, t.deadline_end, t.created_at, t.updated_at
+                FROM task t
+                INNER JOIN task_assignee ta ON t.id = ta.task_id
+                WHERE ta.user_id = $1
+                ORDER BY t.created_at DESC
+                """,
+                user_id,
+            )
 
-        return tasks
+        return self._rows_to_tasks(rows)
 
     async def get_all_with_tag(self, tag_id: int) -> List[Task]:
         """Get all tasks with a specific tag.
@@ -426,25 +591,21 @@ class TaskRepositoryImpl(TaskRepository):
 
         Returns:
             List of Task domain models with the tag
+            (collections not loaded, see prefetch_related)
         """
-        rows = await self.db_conn.fetch(
-            """
-            SELECT t.id, t.title, t.description, t.status_id, t.creator_id, t.deadline_start, t.deadline_end, t.created_at, t.updated_at
-            FROM task t
-            INNER JOIN task_tag tt ON t.id = tt.task_id
-            WHERE tt.tag_id = $1
-            ORDER BY t.created_at DESC
-            """,
-            tag_id,
-        )
-
-        tasks = [self._row_to_task(row) for row in rows]
-
-        # Load related entities
-        for task in tasks:
-            await self._load_related_entities(task)
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT t.id, t.title, t.description, t.status_id, t.creator_id, t.deadline_start, t.deadline_end, t.created_at, t.updated_at
+                FROM task t
+                INNER JOIN task_tag tt ON t.id = tt.task_id
+                WHERE tt.tag_id = $1
+                ORDER BY t.created_at DESC
+                """,
+                tag_id,
+            )
 
-        return tasks
+        return self._rows_to_tasks(rows)
 
     async def get_all_with_attachment(self, attachment_id: int) -> List[Task]:
         """Get all tasks with a specific attachment.
@@ -454,25 +615,21 @@ class TaskRepositoryImpl(TaskRepository):
 
         Returns:
             List of Task domain models with the attachment
+            (collections not loaded, see prefetch_related)
         """
-        rows = await self.db_conn.fetch(
-            """
-            SELECT t.id, t.title, t.description, t.status_id, t.creator_id, t.deadline_start, t.deadline_end, t.created_at, t.updated_at
-            FROM task t
-            INNER JOIN attachment a ON t.id = a.task_id
-            WHERE a.id = $1
-            ORDER BY t.created_at DESC
-            """,
-            attachment_id,
-        )
-
-        tasks = [self._row_to_task(row) for row in rows]
-
-        # Load related entities
-        for task in tasks:
-            await self._load_related_entities(task)
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT t.id, t.title, t.description, t.status_id, t.creator_id, t.deadline_start, t.deadline_end, t.created_at, t.updated_at
+                FROM task t
+                INNER JOIN attachment a ON t.id = a.task_id
+                WHERE a.id = $1
+                ORDER BY t.created_at DESC
+                """,
+                attachment_id,
+            )
 
-        return tasks
+        return self._rows_to_tasks(rows)
 
     async def change_status(self, task_id: int, status_id: int) -> None:
         """Change the status of a task.
@@ -485,15 +642,16 @@ class TaskRepositoryImpl(TaskRepository):
             ValueError: If task not found
             asyncpg.ForeignKeyViolationError: If status_id is invalid
         """
-        result = await self.db_conn.execute(
-            """
-            UPDATE task
-            SET status_id = $1, updated_at = NOW()
-            WHERE id = $2
-            """,
-            status_id,
-            task_id,
-        )
+        async with self.db_pool.acquire() as conn:
+            result = await conn.execute(
+                """
+                UPDATE task
+                SET status_id = $1, updated_at = NOW()
+                WHERE id = $2
+                """,
+                status_id,
+                task_id,
+            )
 
         if result == "UPDATE 0":
             raise ValueError(f"Task with ID {task_id} not found")
@@ -532,15 +690,16 @@ class TaskRepositoryImpl(TaskRepository):
             ValueError: If task or attachment not found
         """
         # Verify that attachment belongs to this task (or update it)
-        result = await self.db_conn.execute(
-            """
-            UPDATE attachment
-            SET task_id = $1
-            WHERE id = $2
-            """,
-            task_id,
-            attachment_id,
-        )
+        async with self.db_pool.acquire() as conn:
+            result = await conn.execute(
+                """
+                UPDATE attachment
+                SET task_id = $1
+                WHERE id = $2
+                """,
+                task_id,
+                attachment_id,
+            )
 
         if result == "UPDATE 0":
             raise ValueError(f"Attachment with ID {attachment_id} not found")
@@ -554,14 +713,15 @@ class TaskRepositoryImpl(TaskRepository):
             task_id: Task identifier
             attachment_id: Attachment identifier
         """
-        result = await self.db_conn.execute(
-            """
-            DELETE FROM attachment
-            WHERE id = $1 AND task_id = $2
-            """,
-            attachment_id,
-            task_id,
-        )
+        async with self.db_pool.acquire() as conn:
+            result = await conn.execute(
+                """
+                DELETE FROM attachment
+                WHERE id = $1 AND task_id = $2
+                """,
+                attachment_id,
+                task_id,
+            )
 
         if result == "DELETE 0":
             raise ValueError(
@@ -578,15 +738,16 @@ class TaskRepositoryImpl(TaskRepository):
         Raises:
             asyncpg.ForeignKeyViolationError: If task or tag not found
         """
-        await self.db_conn.execute(
-            """
-            INSERT INTO task_tag (task_id, tag_id)
-            VALUES ($1, $2)
-            ON CONFLICT (task_id, tag_id) DO NOTHING
-            """,
-            task_id,
-            tag_id,
-        )
+        async with self.db_pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO task_tag (task_id, tag_id)
+                VALUES ($1, $2)
+                ON CONFLICT (task_id, tag_id) DO NOTHING
+                """,
+                task_id,
+                tag_id,
+            )
 
     async def remove_tag(self, task_id: int, tag_id: int) -> None:
         """Remove a tag from a task.
@@ -595,11 +756,12 @@ class TaskRepositoryImpl(TaskRepository):
             task_id: Task identifier
             tag_id: Tag identifier
         """
-        await self.db_conn.execute(
-            """
-            DELETE FROM task_tag
-            WHERE task_id = $1 AND tag_id = $2
-            """,
-            task_id,
-            tag_id,
-        )
+        async with self.db_pool.acquire() as conn:
+            await conn.execute(
+                """
+                DELETE FROM task_tag
+                WHERE task_id = $1 AND tag_id = $2
+                """,
+                task_id,
+                tag_id,
+            )
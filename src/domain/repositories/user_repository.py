@@ -5,21 +5,21 @@ from domain.models.user import User
 
 class UserRepository(ABC):
     @abstractmethod
-    def create(self, user: User) -> User:
+    async def create(self, user: User) -> User:
         pass
 
     @abstractmethod
-    def update(self, user: User) -> User:
+    async def update(self, user: User) -> User:
         pass
 
     @abstractmethod
-    def delete(self, user_id: int) -> None:
+    async def delete(self, user_id: int) -> None:
         pass
 
     @abstractmethod
-    def get_by_username(self, username: str) -> Optional[User]:
+    async def get_by_username(self, username: str) -> Optional[User]:
         pass
 
     @abstractmethod
-    def get_all(self) -> List[User]:
+    async def get_all(self) -> List[User]:
         pass
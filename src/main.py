@@ -6,7 +6,7 @@ This module initializes the FastAPI application and includes all API routers.
 from fastapi import FastAPI
 
 from api.routers import attachments, auth, tags, tasks, users
-from application.services import lifespan
+from database.pool import lifespan
 
 
 # FastAPI application initialization
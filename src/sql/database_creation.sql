@@ -50,6 +50,7 @@ CREATE TABLE IF NOT EXISTS task_assignee (
     assigned_at TIMESTAMP NOT NULL DEFAULT NOW(),
     PRIMARY KEY (task_id, user_id)
 );
+CREATE INDEX IF NOT EXISTS idx_task_assignee_user ON task_assignee(user_id, task_id);
 
 -- Many-to-many: task tags
 CREATE TABLE IF NOT EXISTS task_tag (
@@ -57,6 +58,7 @@ CREATE TABLE IF NOT EXISTS task_tag (
     tag_id INTEGER NOT NULL REFERENCES tag(id) ON DELETE CASCADE,
     PRIMARY KEY (task_id, tag_id)
 );
+CREATE INDEX IF NOT EXISTS idx_task_tag_tag ON task_tag(tag_id, task_id);
 
 -- Attachment
 CREATE TABLE IF NOT EXISTS attachment (
@@ -67,4 +69,5 @@ CREATE TABLE IF NOT EXISTS attachment (
     storage_path TEXT NOT NULL,
     size_bytes BIGINT,
     uploaded_at TIMESTAMP NOT NULL DEFAULT NOW()
-);
\ No newline at end of file
+);
+CREATE INDEX IF NOT EXISTS idx_attachment_task ON attachment(task_id, uploaded_at);
\ No newline at end of file
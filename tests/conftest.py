@@ -1,16 +1,96 @@
 """Main pytest configuration.
 
 This conftest ensures the 'src' directory is in sys.path so that
-domain models can be imported. FastAPI dependencies are loaded
-only for endpoint tests via conditional imports in test files.
+domain models can be imported, and provides the shared async HTTP
+client for endpoint tests.
 """
 
 import sys
 from pathlib import Path
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
 SRC_PATH_STR = str(SRC_PATH)
 
 if SRC_PATH_STR not in sys.path:
-    sys.path.insert(0, SRC_PATH_STR)
\ No newline at end of file
+    sys.path.insert(0, SRC_PATH_STR)
+
+
+# --- Infra: prevent real DB connections during app lifespan ---
+@pytest.fixture(autouse=True, scope="session")
+def _patch_asyncpg_pool():
+    """Patch asyncpg.create_pool to return a FakePool so the app lifespan doesn't hit a real DB."""
+    import asyncpg  # local import
+
+    from fakes import FakePool
+
+    # Endpoint tests override the request-time dependencies with their own
+    # fakes, so the pool created by the lifespan only has to close cleanly
+    async def fake_create_pool(*args, **kwargs):
+        return FakePool()
+
+    original = asyncpg.create_pool
+    asyncpg.create_pool = fake_create_pool  # type: ignore
+    try:
+        yield
+    finally:
+        asyncpg.create_pool = original  # type: ignore
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run async tests on asyncio, sharing one backend for the whole session.
+
+    Overriding the plugin's default keeps the backend fixed to asyncio
+    and lets session-scoped async fixtures depend on it.
+    """
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def anyio_session_runner(anyio_backend):
+    """Keep anyio's test runner open so async tests reuse one event loop.
+
+    The plugin closes its runner once no test or fixture holds it; this
+    session fixture holds it until the end of the run. Async test modules
+    opt in with pytest.mark.anyio and usefixtures("anyio_session_runner").
+    """
+    yield
+
+
+@pytest.fixture(scope="session")
+async def aclient(anyio_backend):
+    """Async HTTP client calling the app in-process, shared by the whole session.
+
+    Requests go straight through httpx's ASGITransport on the test event
+    loop, without TestClient's thread portal. The transport does not run
+    the app lifespan, so it is entered here once for the session. Tests
+    install their fake connection via app.dependency_overrides;
+    _reset_overrides clears them after each test.
+    """
+    # Imported here, not at module level, so an app that fails to import
+    # only breaks the endpoint tests rather than every test's conftest load
+    import httpx
+    from main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            yield c
+
+
+@pytest.fixture(autouse=True)
+def _reset_overrides():
+    """Clear dependency overrides after each test to keep tests isolated.
+
+    Only endpoint tests load the app, so there is nothing to clear unless
+    main has been imported.
+    """
+    try:
+        yield
+    finally:
+        main = sys.modules.get("main")
+        if main is not None:
+            main.app.dependency_overrides.clear()
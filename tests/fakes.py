@@ -0,0 +1,181 @@
+"""Fake asyncpg connection and pool plus shared helpers for the endpoint tests."""
+
+from contextlib import asynccontextmanager, nullcontext
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import pytest
+
+# Endpoint test modules run on the session-wide anyio loop: error-path tests
+# call the route coroutines directly, skipping the HTTP stack; the rest go
+# through the session-wide ASGI client
+ENDPOINT_TEST_MARKS = [pytest.mark.anyio, pytest.mark.usefixtures("anyio_session_runner")]
+
+# Fixed timestamp for fake rows; tests only check timestamps are set.
+# Rows are only read by the endpoints, so modules share them between calls.
+FAKE_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Handler for one scenario: receives the query args, returns the row/value
+Handler = Callable[[tuple], Any]
+
+
+def not_found(args: tuple) -> None:
+    """Handler emulating a query that matched no row."""
+    return None
+
+
+def raising(exc: BaseException) -> Handler:
+    """Build a handler that raises the pre-built exc."""
+    def handler(args: tuple) -> Any:
+        # Drop the previous traceback so it doesn't grow with every re-raise
+        raise exc.with_traceback(None)
+    return handler
+
+
+class FakeConn:
+    """Minimal fake asyncpg connection driven by a scenario registry.
+
+    The registry maps scenario names to handlers; fetchrow and fetchval
+    both answer with the handler of the scenario the fake was built for.
+
+    Args:
+        registry: Scenario name -> handler mapping of the test module
+        scenario: Scenario this connection plays
+
+    Raises:
+        AssertionError: If the scenario is not in the registry
+    """
+
+    def __init__(self, registry: Dict[str, Handler], scenario: str):
+        try:
+            self._handler = registry[scenario]
+        except KeyError:
+            raise AssertionError(f"Unknown scenario: {scenario}") from None
+        self.scenario = scenario
+
+    async def fetchrow(self, query: str, *args: Any) -> Optional[Dict[str, Any]]:
+        return self._handler(args)
+
+    async def fetchval(self, query: str, *args: Any) -> Any:
+        return self._handler(args)
+
+
+class Scenarios:
+    """Scenario registry of one test module, with one FakeConn per scenario.
+
+    Fakes are stateless apart from the scenario, so each instance is built
+    once and shared by every test playing that scenario.
+
+    Args:
+        handlers: Scenario name -> handler mapping
+    """
+
+    def __init__(self, handlers: Dict[str, Handler]):
+        self._fakes = {scenario: FakeConn(handlers, scenario) for scenario in handlers}
+
+    def __getitem__(self, scenario: str) -> FakeConn:
+        try:
+            return self._fakes[scenario]
+        except KeyError:
+            raise AssertionError(f"Unknown scenario: {scenario}") from None
+
+
+def install_fake(registry: Scenarios, scenario: str) -> Iterator[FakeConn]:
+    """Override get_db_connection with the registry's fake until resumed.
+
+    Meant to be driven from a fixture with "yield from".
+
+    Args:
+        registry: Scenario registry of the test module
+        scenario: Scenario to install
+
+    Yields:
+        The installed fake connection
+    """
+    from dependencies import get_db_connection
+    from main import app
+
+    fake = registry[scenario]
+
+    # Plain coroutine: the fake holds no resources, so no teardown is needed
+    async def _override():
+        return fake
+
+    app.dependency_overrides[get_db_connection] = _override
+    try:
+        yield fake
+    finally:
+        app.dependency_overrides.pop(get_db_connection, None)
+
+
+class FakeCursor:
+    """Fake server-side cursor handing out the given rows in batches."""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        self._rows = list(rows)
+
+    async def fetch(self, n: int) -> List[Dict[str, Any]]:
+        batch, self._rows = self._rows[:n], self._rows[n:]
+        return batch
+
+
+class FakePool:
+    """Minimal fake asyncpg pool.
+
+    Stands in for the app lifespan pool and for endpoints that stream
+    through a cursor; acquire() hands out the pool itself as connection.
+
+    Args:
+        rows: Rows returned by the cursor
+        error: Exception raised when the cursor is opened, if any
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]] = (), error: Optional[BaseException] = None):
+        self._rows = rows
+        self._error = error
+        self.in_use = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.in_use += 1
+        try:
+            yield self
+        finally:
+            self.in_use -= 1
+
+    def transaction(self):
+        return nullcontext()
+
+    async def cursor(self, query: str, *args: Any) -> FakeCursor:
+        if self._error is not None:
+            raise self._error
+        return FakeCursor(self._rows)
+
+    async def close(self) -> None:
+        return None
+
+
+def install_pool(pool: FakePool) -> Iterator[FakePool]:
+    """Override get_db_pool with pool until resumed.
+
+    Meant to be driven from a fixture with "yield from".
+
+    Args:
+        pool: Fake pool to install
+
+    Yields:
+        The installed fake pool
+    """
+    from dependencies import get_db_pool
+    from main import app
+
+    async def _override():
+        return pool
+
+    app.dependency_overrides[get_db_pool] = _override
+    try:
+        yield pool
+    finally:
+        app.dependency_overrides.pop(get_db_pool, None)
@@ -0,0 +1,224 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from itertools import product
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from domain.models.task import Task
+from domain.repositories.task_repository_impl import TaskRepositoryImpl
+from fakes import FAKE_NOW, FakePool
+
+_TASK_COLS = {
+    "id": 1,
+    "title": "Write docs",
+    "description": None,
+    "status_id": 1,
+    "creator_id": 1,
+    "deadline_start": None,
+    "deadline_end": None,
+    "created_at": FAKE_NOW,
+    "updated_at": FAKE_NOW,
+}
+_NO_USER = dict.fromkeys(
+    ["user_id", "username", "email", "password_hash", "user_created_at", "last_login", "assigned_at"]
+)
+_NO_TAG = dict.fromkeys(["tag_id", "tag_name", "tag_created_at", "tag_updated_at"])
+_NO_ATTACHMENT = dict.fromkeys(
+    ["attachment_id", "filename", "content_type", "storage_path", "size_bytes", "uploaded_at"]
+)
+
+
+def _at(minutes: int) -> datetime:
+    return FAKE_NOW + timedelta(minutes=minutes)
+
+
+def _user(user_id: int, assigned_at: datetime) -> Dict[str, Any]:
+    return {
+        "user_id": user_id,
+        "username": f"user{user_id}",
+        "email": f"user{user_id}@example.com",
+        "password_hash": "hash",
+        "user_created_at": FAKE_NOW,
+        "last_login": None,
+        "assigned_at": assigned_at,
+    }
+
+
+def _tag(tag_id: int, name: str) -> Dict[str, Any]:
+    return {
+        "tag_id": tag_id,
+        "tag_name": name,
+        "tag_created_at": FAKE_NOW,
+        "tag_updated_at": FAKE_NOW,
+    }
+
+
+def _attachment(attachment_id: int, uploaded_at: datetime) -> Dict[str, Any]:
+    return {
+        "attachment_id": attachment_id,
+        "filename": f"file{attachment_id}.txt",
+        "content_type": "text/plain",
+        "storage_path": "/files",
+        "size_bytes": 10,
+        "uploaded_at": uploaded_at,
+    }
+
+
+def _joined_rows(
+    users: List[Dict[str, Any]],
+    tags: List[Dict[str, Any]],
+    attachments: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Emulate the get_by_id LEFT JOINs: one row per child combination."""
+    return [
+        {**_TASK_COLS, **user, **tag, **attachment}
+        for user, tag, attachment in product(
+            users or [_NO_USER], tags or [_NO_TAG], attachments or [_NO_ATTACHMENT]
+        )
+    ]
+
+
+def _repo(db_pool: Optional[Any] = None) -> TaskRepositoryImpl:
+    return TaskRepositoryImpl(db_pool)
+
+
+def test_joined_rows_dedupes_cross_product():
+    rows = _joined_rows(
+        [_user(10, _at(1)), _user(11, _at(2))],
+        [_tag(20, "a"), _tag(21, "b")],
+        [_attachment(30, _at(1)), _attachment(31, _at(2))],
+    )
+    assert len(rows) == 8
+
+    task = _repo()._joined_rows_to_task(rows)
+
+    assert task.id == 1
+    assert [u.id for u in task.assignees] == [10, 11]
+    assert [t.id for t in task.tags] == [20, 21]
+    assert [a.id for a in task.attachments] == [30, 31]
+    assert all(a.task_id == 1 for a in task.attachments)
+
+
+def test_joined_rows_without_children_gives_empty_lists():
+    task = _repo()._joined_rows_to_task(_joined_rows([], [], []))
+
+    assert task.assignees == []
+    assert task.tags == []
+    assert task.attachments == []
+
+
+def test_joined_rows_orders_children_like_batched_loaders():
+    # Children arrive in reverse; assignees sort by assigned_at,
+    # tags by name and attachments by uploaded_at
+    rows = _joined_rows(
+        [_user(10, _at(5)), _user(11, _at(1))],
+        [_tag(20, "zeta"), _tag(21, "alpha")],
+        [_attachment(30, _at(9)), _attachment(31, _at(3))],
+    )
+
+    task = _repo()._joined_rows_to_task(rows)
+
+    assert [u.id for u in task.assignees] == [11, 10]
+    assert [t.name for t in task.tags] == ["alpha", "zeta"]
+    assert [a.id for a in task.attachments] == [31, 30]
+
+
+class _ChildRowsPool(FakePool):
+    """Fake pool answering the prefetch_related loaders.
+
+    fetch() picks the rows of the table the query joins on and keeps the
+    ones whose task_id is in the ANY($1) array, like the real queries.
+
+    Args:
+        rows_by_table: Table name -> child rows, each with a task_id
+    """
+
+    # Checked in order: the assignee query also mentions "user"
+    _TABLES = ("task_assignee", "task_tag", "attachment")
+
+    def __init__(self, rows_by_table: Dict[str, List[Dict[str, Any]]]):
+        super().__init__()
+        self._rows_by_table = rows_by_table
+        self.acquired = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.acquired += 1
+        async with super().acquire() as conn:
+            yield conn
+
+    async def fetch(self, query: str, task_ids: List[int]) -> List[Dict[str, Any]]:
+        table = next(t for t in self._TABLES if t in query)
+        return [row for row in self._rows_by_table.get(table, []) if row["task_id"] in task_ids]
+
+
+def _task(task_id: int) -> Task:
+    return Task(task_id, f"Task {task_id}", 1, 1, FAKE_NOW, FAKE_NOW)
+
+
+def _assignee_row(task_id: int, user_id: int) -> Dict[str, Any]:
+    return {
+        "task_id": task_id,
+        "id": user_id,
+        "username": f"user{user_id}",
+        "email": f"user{user_id}@example.com",
+        "password_hash": "hash",
+        "created_at": FAKE_NOW,
+        "last_login": None,
+    }
+
+
+def _tag_row(task_id: int, tag_id: int) -> Dict[str, Any]:
+    return {
+        "task_id": task_id,
+        "id": tag_id,
+        "name": f"tag{tag_id}",
+        "created_at": FAKE_NOW,
+        "updated_at": FAKE_NOW,
+    }
+
+
+def _attachment_row(task_id: int, attachment_id: int) -> Dict[str, Any]:
+    return {
+        "task_id": task_id,
+        "id": attachment_id,
+        "filename": f"file{attachment_id}.txt",
+        "content_type": None,
+        "storage_path": "/files",
+        "size_bytes": None,
+        "uploaded_at": FAKE_NOW,
+    }
+
+
+@pytest.mark.anyio
+async def test_prefetch_related_groups_children_per_task():
+    pool = _ChildRowsPool({
+        "task_assignee": [_assignee_row(1, 10), _assignee_row(2, 11), _assignee_row(1, 12)],
+        "task_tag": [_tag_row(2, 20)],
+        "attachment": [_attachment_row(1, 30), _attachment_row(9, 31)],
+    })
+    tasks = [_task(1), _task(2), _task(3)]
+
+    result = await _repo(pool).prefetch_related(tasks)
+
+    assert result is tasks
+    one, two, three = tasks
+    assert [u.id for u in one.assignees] == [10, 12]
+    assert one.tags == []
+    assert [a.id for a in one.attachments] == [30]
+    assert [u.id for u in two.assignees] == [11]
+    assert [t.id for t in two.tags] == [20]
+    assert two.attachments == []
+    # Tasks without children get empty lists, not the unloaded None
+    assert three.assignees == [] and three.tags == [] and three.attachments == []
+    assert pool.acquired == 3
+    assert pool.in_use == 0
+
+
+@pytest.mark.anyio
+async def test_prefetch_related_empty_input_skips_the_pool():
+    pool = _ChildRowsPool({})
+
+    assert await _repo(pool).prefetch_related([]) == []
+    assert pool.acquired == 0
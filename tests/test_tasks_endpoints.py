@@ -1,94 +1,111 @@
-from datetime import datetime, date
-from typing import Any, Dict, Optional
-
-from fastapi import status
-
-from main import app
-from dependencies import get_db_connection
-
-
-class FakeConnTasks:
-    """Minimal fake asyncpg connection for tasks endpoints in tests."""
-
-    def __init__(self, scenario: str):
-        self.scenario = scenario
-
-    async def fetchrow(self, query: str, *args: Any) -> Optional[Dict[str, Any]]:
-        # create_task uses INSERT ... RETURNING; get_task uses SELECT ... WHERE id=$1; update uses UPDATE ... RETURNING
-        if self.scenario == "create_ok":
-            # Map args according to tasks.create_task order
-            title, description, status_id, creator_id, assignee_id, deadline_start, deadline_end = args
-            return {
-                "id": 101,
-                "title": title,
-                "description": description,
-                "status_id": status_id,
-                "creator_id": creator_id,
-                "assignee_id": assignee_id,
-                "deadline_start": deadline_start,
-                "deadline_end": deadline_end,
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
-            }
-        if self.scenario == "get_not_found":
-            return None
-        if self.scenario == "get_ok":
-            return {
-                "id": 101,
-                "title": "Implement API",
-                "description": "Create endpoints",
-                "status_id": 1,
-                "creator_id": 1,
-                "assignee_id": 2,
-                "deadline_start": date.today(),
-                "deadline_end": date.today(),
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
-            }
-        if self.scenario == "update_not_found":
-            return None
-        if self.scenario == "update_ok":
-            # Update returns the whole row after applying changes; emulate minimal
-            return {
-                "id": 101,
-                "title": "Updated title",
-                "description": "Updated description",
-                "status_id": 2,
-                "creator_id": 1,
-                "assignee_id": 3,
-                "deadline_start": date.today(),
-                "deadline_end": date.today(),
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
-            }
-        raise AssertionError(f"Unknown scenario: {self.scenario}")
-
-    async def fetchval(self, query: str, *args: Any) -> Optional[int]:
-        # delete_task uses DELETE ... RETURNING id
-        if self.scenario == "delete_ok":
-            return args[0] if args else 101
-        if self.scenario == "delete_not_found":
-            return None
-        raise AssertionError(f"Unknown scenario for fetchval: {self.scenario}")
-
-
-def test_create_task_success(client):
-    payload = {
-        "title": "Implement API",
-        "description": "Create endpoints",
-        "status_id": 1,
-        "creator_id": 1,
-        "assignee_id": 2,
-        "deadline_start": date.today().isoformat(),
-        "deadline_end": date.today().isoformat(),
+import json
+from typing import Any, Dict
+
+import pytest
+from fastapi import HTTPException, status
+
+from api.routers.tasks import delete_task, get_task, update_task
+from api.schemas.task import TaskUpdate
+from fakes import (
+    ENDPOINT_TEST_MARKS,
+    FAKE_NOW,
+    JSON_HEADERS,
+    FakePool,
+    Scenarios,
+    install_fake,
+    install_pool,
+    not_found,
+)
+
+pytestmark = ENDPOINT_TEST_MARKS
+
+_FAKE_TODAY = FAKE_NOW.date()
+
+_GET_OK_ROW = {
+    "id": 101,
+    "title": "Implement API",
+    "description": "Create endpoints",
+    "status_id": 1,
+    "creator_id": 1,
+    "deadline_start": _FAKE_TODAY,
+    "deadline_end": _FAKE_TODAY,
+    "created_at": FAKE_NOW,
+    "updated_at": FAKE_NOW,
+}
+_UPDATE_OK_ROW = {
+    "id": 101,
+    "title": "Updated title",
+    "description": "Updated description",
+    "status_id": 2,
+    "creator_id": 1,
+    "deadline_start": _FAKE_TODAY,
+    "deadline_end": _FAKE_TODAY,
+    "created_at": FAKE_NOW,
+    "updated_at": FAKE_NOW,
+}
+
+_CREATE_TASK_PAYLOAD = {
+    "title": "Implement API",
+    "description": "Create endpoints",
+    "status_id": 1,
+    "creator_id": 1,
+    "deadline_start": _FAKE_TODAY.isoformat(),
+    "deadline_end": _FAKE_TODAY.isoformat(),
+}
+_CREATE_TASK_JSON = json.dumps(_CREATE_TASK_PAYLOAD).encode()
+_UPDATE_TASK_PAYLOAD = {
+    "title": "Updated title",
+    "description": "Updated description",
+    "status_id": 2,
+}
+
+
+def _create_ok(args: tuple) -> Dict[str, Any]:
+    # Map args according to tasks.create_task order
+    title, description, status_id, creator_id, deadline_start, deadline_end = args
+    return {
+        "id": 101,
+        "title": title,
+        "description": description,
+        "status_id": status_id,
+        "creator_id": creator_id,
+        "deadline_start": deadline_start,
+        "deadline_end": deadline_end,
+        "created_at": FAKE_NOW,
+        "updated_at": FAKE_NOW,
     }
 
-    async def override_conn():
-        yield FakeConnTasks("create_ok")
 
-    app.dependency_overrides[get_db_connection] = override_conn
+# create_task uses INSERT ... RETURNING; get_task uses SELECT ... WHERE id=$1;
+# update uses UPDATE ... RETURNING; delete_task uses DELETE ... RETURNING id
+_TASKS_REG = Scenarios({
+    "create_ok": _create_ok,
+    "get_not_found": not_found,
+    "get_ok": lambda args: _GET_OK_ROW,
+    "update_not_found": not_found,
+    # Update returns the whole row after applying changes; emulate minimal
+    "update_ok": lambda args: _UPDATE_OK_ROW,
+    "delete_ok": lambda args: args[0] if args else 101,
+    "delete_not_found": not_found,
+})
 
-    resp = client.post("/tasks/", json=payload)
+
+@pytest.fixture
+def fake_conn(request):
+    """Install the fake tasks connection for the scenario given via indirect parametrize."""
+    yield from install_fake(_TASKS_REG, request.param)
+
+
+@pytest.fixture
+def fake_pool(request):
+    """Install the FakePool given via indirect parametrize as the db pool."""
+    yield from install_pool(request.param)
+
+
+@pytest.mark.parametrize("fake_conn", ["create_ok"], indirect=True)
+async def test_create_task_success(aclient, fake_conn):
+    payload = _CREATE_TASK_PAYLOAD
+    resp = await aclient.post("/tasks/", content=_CREATE_TASK_JSON, headers=JSON_HEADERS)
     assert resp.status_code == status.HTTP_201_CREATED, resp.text
     data = resp.json()
 
@@ -96,29 +113,22 @@ def test_create_task_success(client):
     assert data["title"] == payload["title"]
     assert data["status_id"] == payload["status_id"]
     assert data["creator_id"] == payload["creator_id"]
-    assert data["assignee_id"] == payload["assignee_id"]
+    assert data["deadline_start"] == payload["deadline_start"]
+    assert data["deadline_end"] == payload["deadline_end"]
     assert "created_at" in data and data["created_at"]
     assert "updated_at" in data and data["updated_at"]
 
 
-def test_get_task_not_found(client):
-    async def override_conn():
-        yield FakeConnTasks("get_not_found")
-
-    app.dependency_overrides[get_db_connection] = override_conn
+async def test_get_task_not_found():
+    with pytest.raises(HTTPException) as exc_info:
+        await get_task(task_id=424242, conn=_TASKS_REG["get_not_found"])
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    assert "not found" in exc_info.value.detail.lower()
 
-    resp = client.get("/tasks/424242")
-    assert resp.status_code == status.HTTP_404_NOT_FOUND
-    assert "not found" in resp.json()["detail"].lower()
 
-
-def test_get_task_success(client):
-    async def override_conn():
-        yield FakeConnTasks("get_ok")
-
-    app.dependency_overrides[get_db_connection] = override_conn
-
-    resp = client.get("/tasks/101")
+@pytest.mark.parametrize("fake_conn", ["get_ok"], indirect=True)
+async def test_get_task_success(aclient, fake_conn):
+    resp = await aclient.get("/tasks/101")
     assert resp.status_code == status.HTTP_200_OK
     data = resp.json()
 
@@ -126,64 +136,66 @@ def test_get_task_success(client):
     assert data["title"] == "Implement API"
     assert data["status_id"] == 1
     assert data["creator_id"] == 1
-    assert data["assignee_id"] == 2
+    assert data["description"] == "Create endpoints"
     assert "created_at" in data and data["created_at"]
     assert "updated_at" in data and data["updated_at"]
 
 
-def test_update_task_not_found(client):
-    async def override_conn():
-        yield FakeConnTasks("update_not_found")
-
-    app.dependency_overrides[get_db_connection] = override_conn
-
+async def test_update_task_not_found():
     # provide one field to trigger UPDATE path rather than validation error
-    resp = client.put("/tasks/424242", json={"title": "X"})
-    assert resp.status_code == status.HTTP_404_NOT_FOUND
-    assert "not found" in resp.json()["detail"].lower()
-
-
-
-def test_update_task_success(client):
-    async def override_conn():
-        yield FakeConnTasks("update_ok")
-
-    app.dependency_overrides[get_db_connection] = override_conn
-
-    payload = {
-        "title": "Updated title",
-        "description": "Updated description",
-        "status_id": 2,
-        "assignee_id": 3,
-    }
-    resp = client.put("/tasks/101", json=payload)
+    with pytest.raises(HTTPException) as exc_info:
+        await update_task(
+            task_id=424242,
+            task=TaskUpdate(title="X"),
+            conn=_TASKS_REG["update_not_found"],
+        )
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    assert "not found" in exc_info.value.detail.lower()
+
+
+@pytest.mark.parametrize("fake_conn", ["update_ok"], indirect=True)
+async def test_update_task_success(aclient, fake_conn):
+    payload = _UPDATE_TASK_PAYLOAD
+    resp = await aclient.put("/tasks/101", json=payload)
     assert resp.status_code == status.HTTP_200_OK
     data = resp.json()
     assert data["id"] == 101
     assert data["title"] == "Updated title"
     assert data["status_id"] == 2
-    assert data["assignee_id"] == 3
+    assert data["description"] == "Updated description"
     assert "updated_at" in data and data["updated_at"]
 
 
+async def test_delete_task_not_found():
+    with pytest.raises(HTTPException) as exc_info:
+        await delete_task(task_id=424242, conn=_TASKS_REG["delete_not_found"])
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    assert "not found" in exc_info.value.detail.lower()
 
-def test_delete_task_not_found(client):
-    async def override_conn():
-        yield FakeConnTasks("delete_not_found")
-
-    app.dependency_overrides[get_db_connection] = override_conn
 
-    resp = client.delete("/tasks/424242")
-    assert resp.status_code == status.HTTP_404_NOT_FOUND
-    assert "not found" in resp.json()["detail"].lower()
-
-
-
-def test_delete_task_success(client):
-    async def override_conn():
-        yield FakeConnTasks("delete_ok")
+@pytest.mark.parametrize("fake_conn", ["delete_ok"], indirect=True)
+async def test_delete_task_success(aclient, fake_conn):
+    resp = await aclient.delete("/tasks/101")
+    assert resp.status_code == status.HTTP_204_NO_CONTENT
 
-    app.dependency_overrides[get_db_connection] = override_conn
 
-    resp = client.delete("/tasks/101")
-    assert resp.status_code == status.HTTP_204_NO_CONTENT
+@pytest.mark.parametrize(
+    "fake_pool", [FakePool([_GET_OK_ROW, {**_UPDATE_OK_ROW, "id": 102}])], indirect=True
+)
+async def test_list_tasks_streams_ndjson(aclient, fake_pool):
+    resp = await aclient.get("/tasks/")
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    tasks = [json.loads(line) for line in resp.text.splitlines()]
+    assert [t["id"] for t in tasks] == [101, 102]
+    assert tasks[0]["title"] == "Implement API"
+    assert tasks[1]["title"] == "Updated title"
+    # The cursor connection goes back to the pool once the stream ends
+    assert fake_pool.in_use == 0
+
+
+@pytest.mark.parametrize("fake_pool", [FakePool(error=RuntimeError("boom"))], indirect=True)
+async def test_list_tasks_cursor_error_500(aclient, fake_pool):
+    resp = await aclient.get("/tasks/")
+    assert resp.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert fake_pool.in_use == 0
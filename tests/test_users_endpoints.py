@@ -1,95 +1,121 @@
-from datetime import datetime
-from typing import Any, Dict, Optional
+import json
+from typing import Any, Dict
 
 import asyncpg
 import pytest
-from fastapi import status
-
-from main import app
-from dependencies import get_db_connection
-
-
-class FakeConnUsers:
-    """Minimal fake asyncpg connection for users endpoints in tests.
-
-    Scenarios:
-      - create_ok: POST returns a valid row
-      - get_not_found: GET returns None
-      - duplicate_username / duplicate_email: raise UniqueViolationError
-      - boom: raise generic unexpected error
-      - get_ok: GET returns a valid row
-    """
-
-    def __init__(self, scenario: str):
-        self.scenario = scenario
-
-    async def fetchrow(self, query: str, *args: Any) -> Optional[Dict[str, Any]]:
-        if self.scenario == "create_ok":
-            # Emulate row returned by INSERT ... RETURNING in users.create_user
-            return {
-                "id": 1,
-                "username": args[0],
-                "email": args[1],
-                "created_at": datetime.utcnow(),
-                "last_login": None,
-            }
-        if self.scenario == "get_ok":
-            return {
-                "id": 7,
-                "username": "bob",
-                "email": "b@example.com",
-                "created_at": datetime.utcnow(),
-                "last_login": None,
-            }
-        if self.scenario == "update_ok":
-            return {
-                "id": 1,
-                "username": "newname",
-                "email": "new@example.com",
-                "created_at": datetime.utcnow(),
-                "last_login": None,
-            }
-        if self.scenario == "get_not_found" or self.scenario == "update_not_found":
-            return None
-        if self.scenario == "duplicate_username":
-            raise asyncpg.UniqueViolationError("username already exists")
-        if self.scenario == "duplicate_email":
-            raise asyncpg.UniqueViolationError("email already exists")
-        if self.scenario == "boom":
-            raise RuntimeError("boom")
-        raise AssertionError(f"Unknown scenario: {self.scenario}")
-
-    async def fetchval(self, query: str, *args: Any):
-        # Used by DELETE endpoint tests; decide by scenario
-        if self.scenario == "delete_ok":
-            return 1
-        if self.scenario == "delete_not_found":
-            return None
-        if self.scenario == "delete_fk_err":
-            raise asyncpg.ForeignKeyViolationError("fk")
-        if self.scenario == "boom":
-            raise RuntimeError("boom")
-        raise AssertionError(f"Unknown scenario for fetchval: {self.scenario}")
-
-
-@pytest.mark.parametrize(
-    "payload",
-    [
-        {
-            "username": "alice",
-            "email": "alice@example.com",
-            "password": "secret",
-        }
-    ],
+from fastapi import HTTPException, status
+
+from api.routers.users import delete_user, get_user, update_user
+from api.schemas.user import UserUpdate
+from fakes import (
+    ENDPOINT_TEST_MARKS,
+    FAKE_NOW,
+    JSON_HEADERS,
+    Scenarios,
+    install_fake,
+    not_found,
+    raising,
+)
+
+pytestmark = ENDPOINT_TEST_MARKS
+
+_GET_OK_ROW = {
+    "id": 7,
+    "username": "bob",
+    "email": "b@example.com",
+    "created_at": FAKE_NOW,
+    "last_login": None,
+}
+_UPDATE_OK_ROW = {
+    "id": 1,
+    "username": "newname",
+    "email": "new@example.com",
+    "created_at": FAKE_NOW,
+    "last_login": None,
+}
+
+_CREATE_USER_PAYLOAD = {"username": "alice", "email": "alice@example.com", "password": "secret"}
+_CREATE_USER_JSON = json.dumps(_CREATE_USER_PAYLOAD).encode()
+_UPDATE_EMAIL_JSON = json.dumps({"email": "x@example.com"}).encode()
+# (method, url, body) for each endpoint hit by an unexpected DB error
+_ERROR_500_CASES = (
+    ("POST", "/users/", _CREATE_USER_JSON),
+    ("GET", "/users/1", None),
+    ("PUT", "/users/1", _UPDATE_EMAIL_JSON),
+    ("DELETE", "/users/1", None),
+)
+# (method, url, body) for each endpoint given a non-integer user id
+_INVALID_ID_CASES = (
+    ("GET", "/users/not-an-int", None),
+    ("PUT", "/users/not-an-int", _UPDATE_EMAIL_JSON),
+    ("DELETE", "/users/not-an-int", None),
+)
+_UPDATE_VARIANTS = (
+    {"username": "newname"},
+    {"email": "new@example.com"},
+    {"password": "newpass"},
+    {"username": "u", "email": "e@example.com"},
+    {"email": "e@example.com", "password": "p"},
+    {"username": "u", "password": "p"},
+    {"username": "u", "email": "e@example.com", "password": "p"},
 )
-def test_create_user_success(client, payload):
-    async def override_conn():
-        yield FakeConnUsers("create_ok")
 
-    # Override the DB connection dependency just for this test
-    app.dependency_overrides[get_db_connection] = override_conn
 
-    resp = client.post("/users/", json=payload)
+def _create_ok(args: tuple) -> Dict[str, Any]:
+    # Emulate row returned by INSERT ... RETURNING in users.create_user
+    return {
+        "id": 1,
+        "username": args[0],
+        "email": args[1],
+        "created_at": FAKE_NOW,
+        "last_login": None,
+    }
+
+
+# Errors are built once and re-raised by every scenario that needs them
+_DUPLICATE_USERNAME_EXC = asyncpg.UniqueViolationError("username already exists")
+_DUPLICATE_EMAIL_EXC = asyncpg.UniqueViolationError("email already exists")
+_FK_EXC = asyncpg.ForeignKeyViolationError("fk")
+_BOOM_EXC = RuntimeError("boom")
+
+# Scenarios:
+#   - create_ok: POST returns a valid row
+#   - get_ok / update_ok: GET / PUT return a valid row
+#   - get_not_found / update_not_found / delete_not_found: no row
+#   - duplicate_username / duplicate_email: raise UniqueViolationError
+#   - delete_ok / delete_fk_err: DELETE succeeds / hits a foreign key
+#   - boom: raise generic unexpected error
+_USERS_REG = Scenarios({
+    "create_ok": _create_ok,
+    "get_ok": lambda args: _GET_OK_ROW,
+    "update_ok": lambda args: _UPDATE_OK_ROW,
+    "get_not_found": not_found,
+    "update_not_found": not_found,
+    "duplicate_username": raising(_DUPLICATE_USERNAME_EXC),
+    "duplicate_email": raising(_DUPLICATE_EMAIL_EXC),
+    "boom": raising(_BOOM_EXC),
+    "delete_ok": lambda args: 1,
+    "delete_not_found": not_found,
+    "delete_fk_err": raising(_FK_EXC),
+})
+
+
+@pytest.fixture
+def fake_conn_users(request):
+    """Install the fake users connection for the scenario given via indirect parametrize."""
+    yield from install_fake(_USERS_REG, request.param)
+
+
+@pytest.fixture
+def boom_override():
+    """Install the fake users connection whose every query raises an unexpected error."""
+    yield from install_fake(_USERS_REG, "boom")
+
+
+@pytest.mark.parametrize("fake_conn_users", ["create_ok"], indirect=True)
+async def test_create_user_success(aclient, fake_conn_users):
+    payload = _CREATE_USER_PAYLOAD
+    resp = await aclient.post("/users/", content=_CREATE_USER_JSON, headers=JSON_HEADERS)
     assert resp.status_code == status.HTTP_201_CREATED, resp.text
     data = resp.json()
 
@@ -101,180 +127,111 @@ def test_create_user_success(client, payload):
     assert "last_login" in data
 
 
-def test_get_user_not_found(client):
-    async def override_conn():
-        yield FakeConnUsers("get_not_found")
-
-    app.dependency_overrides[get_db_connection] = override_conn
-
-    resp = client.get("/users/9999")
-    assert resp.status_code == status.HTTP_404_NOT_FOUND
-    assert "not found" in resp.json()["detail"].lower()
-
-def test_create_user_duplicate_username(client):
-    async def override_conn():
-        yield FakeConnUsers("duplicate_username")
+async def test_get_user_not_found():
+    with pytest.raises(HTTPException) as exc_info:
+        await get_user(user_id=9999, conn=_USERS_REG["get_not_found"])
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    assert "not found" in exc_info.value.detail.lower()
 
-    app.dependency_overrides[get_db_connection] = override_conn
-
-    resp = client.post(
-        "/users/", json={"username": "alice", "email": "alice@example.com", "password": "x"}
-    )
+@pytest.mark.parametrize("fake_conn_users", ["duplicate_username"], indirect=True)
+async def test_create_user_duplicate_username(aclient, fake_conn_users):
+    resp = await aclient.post("/users/", content=_CREATE_USER_JSON, headers=JSON_HEADERS)
     assert resp.status_code == status.HTTP_409_CONFLICT
     assert "already exists" in resp.json()["detail"].lower()
 
 
 # --- Additional tests for users endpoints ---
 
-def test_create_user_500_error(client):
-    async def override_conn():
-        yield FakeConnUsers("boom")
-    app.dependency_overrides[get_db_connection] = override_conn
-    resp = client.post(
-        "/users/", json={"username": "alice", "email": "a@e.com", "password": "x"}
-    )
-    assert resp.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-
-
-def test_create_user_validation_422_missing_fields(client):
+async def test_create_user_validation_422_missing_fields(aclient):
     # No override needed; validation happens before dependency is used
-    resp = client.post("/users/", json={})
+    resp = await aclient.post("/users/", json={})
     assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
-def test_create_user_validation_422_wrong_types(client):
-    resp = client.post("/users/", json={"username": 123, "email": 456, "password": 789})
+async def test_create_user_validation_422_wrong_types(aclient):
+    resp = await aclient.post("/users/", json={"username": 123, "email": 456, "password": 789})
     assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
-def test_create_user_response_no_password(client):
-    async def override_conn():
-        yield FakeConnUsers("create_ok")
-    app.dependency_overrides[get_db_connection] = override_conn
-    resp = client.post(
-        "/users/", json={"username": "alice", "email": "a@e.com", "password": "x"}
-    )
+@pytest.mark.parametrize("fake_conn_users", ["create_ok"], indirect=True)
+async def test_create_user_response_no_password(aclient, fake_conn_users):
+    resp = await aclient.post("/users/", content=_CREATE_USER_JSON, headers=JSON_HEADERS)
     assert resp.status_code == status.HTTP_201_CREATED
     assert "password" not in resp.json()
 
 
-def test_get_user_success(client):
-    async def override_conn():
-        yield FakeConnUsers("get_ok")
-    app.dependency_overrides[get_db_connection] = override_conn
-    resp = client.get("/users/7")
+@pytest.mark.parametrize("fake_conn_users", ["get_ok"], indirect=True)
+async def test_get_user_success(aclient, fake_conn_users):
+    resp = await aclient.get("/users/7")
     assert resp.status_code == status.HTTP_200_OK
     data = resp.json()
     assert set(["id", "username", "email", "created_at", "last_login"]).issubset(data.keys())
 
 
-def test_get_user_invalid_id_422(client):
-    resp = client.get("/users/not-an-int")
-    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-
-def test_get_user_500_error(client):
-    async def override_conn():
-        yield FakeConnUsers("boom")
-    app.dependency_overrides[get_db_connection] = override_conn
-    resp = client.get("/users/1")
-    assert resp.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-
-
-def test_update_user_no_fields_400(client):
-    async def override_conn():
-        yield FakeConnUsers("update_ok")
-    app.dependency_overrides[get_db_connection] = override_conn
-    resp = client.put("/users/1", json={})
+@pytest.mark.parametrize("fake_conn_users", ["update_ok"], indirect=True)
+async def test_update_user_no_fields_400(aclient, fake_conn_users):
+    resp = await aclient.put("/users/1", json={})
     assert resp.status_code == status.HTTP_400_BAD_REQUEST
     assert "at least one field" in resp.json()["detail"].lower()
 
 
-@pytest.mark.parametrize(
-    "payload",
-    [
-        {"username": "newname"},
-        {"email": "new@example.com"},
-        {"password": "newpass"},
-        {"username": "u", "email": "e@example.com"},
-        {"email": "e@example.com", "password": "p"},
-        {"username": "u", "password": "p"},
-        {"username": "u", "email": "e@example.com", "password": "p"},
-    ],
-)
-def test_update_user_success_variants(client, payload):
-    async def override_conn():
-        yield FakeConnUsers("update_ok")
-    app.dependency_overrides[get_db_connection] = override_conn
-    resp = client.put("/users/1", json=payload)
+@pytest.mark.parametrize("payload", _UPDATE_VARIANTS)
+@pytest.mark.parametrize("fake_conn_users", ["update_ok"], indirect=True)
+async def test_update_user_success_variants(aclient, fake_conn_users, payload):
+    resp = await aclient.put("/users/1", json=payload)
     assert resp.status_code == status.HTTP_200_OK
     data = resp.json()
     assert set(["id", "username", "email", "created_at", "last_login"]).issubset(data.keys())
     assert "password" not in data
 
 
-def test_update_user_not_found_404(client):
-    async def override_conn():
-        yield FakeConnUsers("update_not_found")
-    app.dependency_overrides[get_db_connection] = override_conn
-    resp = client.put("/users/9999", json={"email": "x@example.com"})
-    assert resp.status_code == status.HTTP_404_NOT_FOUND
+async def test_update_user_not_found_404():
+    with pytest.raises(HTTPException) as exc_info:
+        await update_user(
+            user_id=9999,
+            user=UserUpdate(email="x@example.com"),
+            conn=_USERS_REG["update_not_found"],
+        )
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_update_user_unique_conflict_409(client):
-    async def override_conn():
-        yield FakeConnUsers("duplicate_email")
-    app.dependency_overrides[get_db_connection] = override_conn
-    resp = client.put("/users/1", json={"email": "dupe@example.com"})
-    assert resp.status_code == status.HTTP_409_CONFLICT
-
+async def test_update_user_unique_conflict_409():
+    with pytest.raises(HTTPException) as exc_info:
+        await update_user(
+            user_id=1,
+            user=UserUpdate(email="dupe@example.com"),
+            conn=_USERS_REG["duplicate_email"],
+        )
+    assert exc_info.value.status_code == status.HTTP_409_CONFLICT
 
-def test_update_user_invalid_id_422(client):
-    resp = client.put("/users/not-an-int", json={"email": "x@example.com"})
-    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-
-def test_update_user_500_error(client):
-    async def override_conn():
-        yield FakeConnUsers("boom")
-    app.dependency_overrides[get_db_connection] = override_conn
-    resp = client.put("/users/1", json={"email": "x@example.com"})
-    assert resp.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-
-
-def test_delete_user_success_204(client):
-    async def override_conn():
-        yield FakeConnUsers("delete_ok")
-    app.dependency_overrides[get_db_connection] = override_conn
-    resp = client.delete("/users/1")
+@pytest.mark.parametrize("fake_conn_users", ["delete_ok"], indirect=True)
+async def test_delete_user_success_204(aclient, fake_conn_users):
+    resp = await aclient.delete("/users/1")
     assert resp.status_code == status.HTTP_204_NO_CONTENT
     assert resp.text == ""
 
 
-def test_delete_user_not_found_404(client):
-    async def override_conn():
-        yield FakeConnUsers("delete_not_found")
-    app.dependency_overrides[get_db_connection] = override_conn
-    resp = client.delete("/users/9999")
-    assert resp.status_code == status.HTTP_404_NOT_FOUND
+async def test_delete_user_not_found_404():
+    with pytest.raises(HTTPException) as exc_info:
+        await delete_user(user_id=9999, conn=_USERS_REG["delete_not_found"])
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_delete_user_fk_violation_400(client):
-    async def override_conn():
-        yield FakeConnUsers("delete_fk_err")
-    app.dependency_overrides[get_db_connection] = override_conn
-    resp = client.delete("/users/1")
-    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+async def test_delete_user_fk_violation_400():
+    with pytest.raises(HTTPException) as exc_info:
+        await delete_user(user_id=1, conn=_USERS_REG["delete_fk_err"])
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
 
 
-def test_delete_user_invalid_id_422(client):
-    resp = client.delete("/users/not-an-int")
-    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+async def test_user_invalid_id_422(aclient):
+    # No override needed; path validation fails before the dependency is used
+    for method, url, body in _INVALID_ID_CASES:
+        resp = await aclient.request(method, url, content=body, headers=JSON_HEADERS)
+        assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, (method, url)
 
 
-def test_delete_user_500_error(client):
-    async def override_conn():
-        yield FakeConnUsers("boom")
-    app.dependency_overrides[get_db_connection] = override_conn
-    resp = client.delete("/users/1")
+@pytest.mark.parametrize("method,url,body", _ERROR_500_CASES, ids=["create", "get", "update", "delete"])
+async def test_users_500_error(aclient, boom_override, method, url, body):
+    resp = await aclient.request(method, url, content=body, headers=JSON_HEADERS)
     assert resp.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR